@@ -4,10 +4,14 @@ from __future__ import annotations
 import asyncio
 import datetime # Added for timedelta
 import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, replace
+from functools import cached_property
 from typing import Any
 
 import aiohttp
-import async_timeout
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
@@ -15,11 +19,19 @@ from homeassistant.const import (
     CONF_HOST,
     CONF_PASSWORD,
     CONF_USERNAME,
+    EVENT_HOMEASSISTANT_CLOSE,
     Platform,
 )
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import (
+    ConfigEntryAuthFailed,
+    ConfigEntryError,
+    ConfigEntryNotReady,
+    HomeAssistantError,
+)
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -36,19 +48,30 @@ from nanokvm.models import GpioType
 from .const import (
     ATTR_BUTTON_TYPE,
     ATTR_DURATION,
+    ATTR_ENTRY_ID,
     ATTR_MAC,
     ATTR_TEXT,
     BUTTON_TYPE_POWER,
     BUTTON_TYPE_RESET,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    REQUEST_REFRESH_COOLDOWN,
     SERVICE_PASTE_TEXT,
     SERVICE_PUSH_BUTTON,
     SERVICE_REBOOT,
     SERVICE_RESET_HDMI,
     SERVICE_RESET_HID,
+    SERVICE_TIMEOUT,
     SERVICE_WAKE_ON_LAN,
+    SLOW_POLL_CYCLES,
+    STALE_FIELD_MAX_FAILURES,
+    UPDATE_RETRY_ATTEMPTS,
+    UPDATE_RETRY_BASE_DELAY,
+    UPDATE_RETRY_MAX_DELAY,
 )
+from .util import api_url
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -59,161 +82,170 @@ PLATFORMS = [
     Platform.SWITCH,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 # Service schemas
-PUSH_BUTTON_SCHEMA = vol.Schema(
+SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+    }
+)
+
+PUSH_BUTTON_SCHEMA = SERVICE_SCHEMA.extend(
     {
         vol.Required(ATTR_BUTTON_TYPE): vol.In([BUTTON_TYPE_POWER, BUTTON_TYPE_RESET]),
         vol.Optional(ATTR_DURATION, default=100): vol.All(
-            vol.Coerce(int), vol.Range(min=100, max=5000)
+            int, vol.Range(min=100, max=5000)
         ),
     }
 )
 
-PASTE_TEXT_SCHEMA = vol.Schema(
+PASTE_TEXT_SCHEMA = SERVICE_SCHEMA.extend(
     {
         vol.Required(ATTR_TEXT): str,
     }
 )
 
-WAKE_ON_LAN_SCHEMA = vol.Schema(
+WAKE_ON_LAN_SCHEMA = SERVICE_SCHEMA.extend(
     {
         vol.Required(ATTR_MAC): str,
     }
 )
 
 
+# Service name -> (schema, client call made for each targeted NanoKVM)
+SERVICE_MAP: dict[
+    str,
+    tuple[vol.Schema, Callable[[NanoKVMClient, dict[str, Any]], Awaitable[Any]]],
+] = {
+    SERVICE_PUSH_BUTTON: (
+        PUSH_BUTTON_SCHEMA,
+        lambda client, data: client.push_button(
+            GpioType.POWER
+            if data[ATTR_BUTTON_TYPE] == BUTTON_TYPE_POWER
+            else GpioType.RESET,
+            data[ATTR_DURATION],
+        ),
+    ),
+    SERVICE_PASTE_TEXT: (
+        PASTE_TEXT_SCHEMA,
+        lambda client, data: client.paste_text(data[ATTR_TEXT]),
+    ),
+    SERVICE_REBOOT: (SERVICE_SCHEMA, lambda client, _: client.reboot_system()),
+    SERVICE_RESET_HDMI: (SERVICE_SCHEMA, lambda client, _: client.reset_hdmi()),
+    SERVICE_RESET_HID: (SERVICE_SCHEMA, lambda client, _: client.reset_hid()),
+    SERVICE_WAKE_ON_LAN: (
+        WAKE_ON_LAN_SCHEMA,
+        lambda client, data: client.send_wake_on_lan(data[ATTR_MAC]),
+    ),
+}
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Sipeed NanoKVM services."""
+    hass.data.setdefault(DOMAIN, {})
+
+    for service, (schema, action) in SERVICE_MAP.items():
+        hass.services.async_register(
+            DOMAIN, service, _make_service_handler(hass, service, action), schema=schema
+        )
+
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Sipeed NanoKVM from a config entry."""
-    host = entry.data[CONF_HOST]
     username = entry.data[CONF_USERNAME]
     password = entry.data[CONF_PASSWORD]
 
-    # Ensure the host has a scheme
-    if not host.startswith(("http://", "https://")):
-        host = f"http://{host}"
-    
-    # Ensure the host ends with /api/
-    if not host.endswith("/api/"):
-        host = f"{host}/api/" if host.endswith("/") else f"{host}/api/"
+    # Normalize the host the same way the config flow validated it
+    if (host := api_url(entry.data[CONF_HOST])) is None:
+        raise ConfigEntryError(f"Invalid NanoKVM host: {entry.data[CONF_HOST]}")
 
-    session = async_get_clientsession(hass)
+    # Use a dedicated session so concurrent polls and service calls share a
+    # small pool of keep-alive connections to the NanoKVM. Only connecting is
+    # capped here: polls and service calls have their own, different timeouts.
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=4, keepalive_timeout=75),
+        timeout=aiohttp.ClientTimeout(connect=3),
+    )
+
+    async def _async_close_session(_: Event) -> None:
+        """Close the session when Home Assistant stops without unloading."""
+        await session.close()
+
+    entry.async_on_unload(session.close)
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
     client = NanoKVMClient(host, session)
 
     try:
         await client.authenticate(username, password)
-        device_info = await client.get_info() # Fetch device_info immediately
     except NanoKVMAuthenticationFailure as err:
-        _LOGGER.error("Authentication failed: %s", err)
-        return False
+        raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
     except (aiohttp.ClientError, NanoKVMError) as err:
         _LOGGER.error("Failed to connect: %s", err)
         raise ConfigEntryNotReady from err
 
-    coordinator = NanoKVMDataUpdateCoordinator(
-        hass,
-        client=client,
-        username=username,
-        password=password,
-        device_info=device_info, # Pass device_info to coordinator
-    )
+    coordinator = NanoKVMDataUpdateCoordinator(hass, client=client)
 
     await coordinator.async_config_entry_first_refresh()
 
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register services
-    async def handle_push_button(call: ServiceCall) -> None:
-        """Handle the push button service."""
-        button_type = call.data[ATTR_BUTTON_TYPE]
-        duration = call.data[ATTR_DURATION]
-        
-        gpio_type = GpioType.POWER if button_type == BUTTON_TYPE_POWER else GpioType.RESET
-        
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            client = coordinator.client
-            try:
-                await client.push_button(gpio_type, duration)
-                _LOGGER.debug("Button %s pushed for %d ms", button_type, duration)
-            except Exception as err:
-                _LOGGER.error("Failed to push button: %s", err)
-
-    async def handle_paste_text(call: ServiceCall) -> None:
-        """Handle the paste text service."""
-        text = call.data[ATTR_TEXT]
-        
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            client = coordinator.client
-            try:
-                await client.paste_text(text)
-                _LOGGER.debug("Text pasted: %s", text)
-            except Exception as err:
-                _LOGGER.error("Failed to paste text: %s", err)
-
-    async def handle_reboot(call: ServiceCall) -> None:
-        """Handle the reboot service."""
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            client = coordinator.client
-            try:
-                await client.reboot_system()
-                _LOGGER.debug("System reboot initiated")
-            except Exception as err:
-                _LOGGER.error("Failed to reboot system: %s", err)
-
-    async def handle_reset_hdmi(call: ServiceCall) -> None:
-        """Handle the reset HDMI service."""
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            client = coordinator.client
-            try:
-                await client.reset_hdmi()
-                _LOGGER.debug("HDMI reset initiated")
-            except Exception as err:
-                _LOGGER.error("Failed to reset HDMI: %s", err)
-
-    async def handle_reset_hid(call: ServiceCall) -> None:
-        """Handle the reset HID service."""
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            client = coordinator.client
-            try:
-                await client.reset_hid()
-                _LOGGER.debug("HID reset initiated")
-            except Exception as err:
-                _LOGGER.error("Failed to reset HID: %s", err)
-
-    async def handle_wake_on_lan(call: ServiceCall) -> None:
-        """Handle the wake on LAN service."""
-        mac = call.data[ATTR_MAC]
-        
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            client = coordinator.client
-            try:
-                await client.send_wake_on_lan(mac)
-                _LOGGER.debug("Wake on LAN packet sent to %s", mac)
-            except Exception as err:
-                _LOGGER.error("Failed to send Wake on LAN: %s", err)
+    return True
 
-    hass.services.async_register(
-        DOMAIN, SERVICE_PUSH_BUTTON, handle_push_button, schema=PUSH_BUTTON_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_PASTE_TEXT, handle_paste_text, schema=PASTE_TEXT_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_REBOOT, handle_reboot
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_RESET_HDMI, handle_reset_hdmi
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_RESET_HID, handle_reset_hid
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_WAKE_ON_LAN, handle_wake_on_lan, schema=WAKE_ON_LAN_SCHEMA
-    )
 
-    return True
+def _make_service_handler(
+    hass: HomeAssistant,
+    service: str,
+    action: Callable[[NanoKVMClient, dict[str, Any]], Awaitable[Any]],
+) -> Callable[[ServiceCall], Awaitable[None]]:
+    """Create a handler that runs a service on the targeted NanoKVM devices.
+
+    A call with an entry_id targets that device only; without one the action is
+    sent to every configured device concurrently.
+    """
+
+    async def call_action(client: NanoKVMClient, data: dict[str, Any]) -> Any:
+        """Run the action, giving up if the NanoKVM stops responding."""
+        async with asyncio.timeout(SERVICE_TIMEOUT):
+            return await action(client, data)
+
+    async def handle_service(call: ServiceCall) -> None:
+        """Handle a NanoKVM service call."""
+        coordinators: dict[str, NanoKVMDataUpdateCoordinator] = hass.data[DOMAIN]
+
+        if (entry_id := call.data.get(ATTR_ENTRY_ID)) is not None:
+            if entry_id not in coordinators:
+                raise HomeAssistantError(f"NanoKVM entry {entry_id} is not loaded")
+            try:
+                await call_action(coordinators[entry_id].client, call.data)
+            except (aiohttp.ClientError, NanoKVMError, TimeoutError) as err:
+                raise HomeAssistantError(
+                    f"Failed to call {service} on {entry_id}: {err}"
+                ) from err
+            _LOGGER.debug("Called %s on %s", service, entry_id)
+            return
+
+        # A broadcast should reach every device, so failures are only logged
+        results = await asyncio.gather(
+            *(
+                call_action(coordinator.client, call.data)
+                for coordinator in coordinators.values()
+            ),
+            return_exceptions=True,
+        )
+        for entry_id, result in zip(coordinators, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Failed to call %s on %s: %s", service, entry_id, result)
+            else:
+                _LOGGER.debug("Called %s on %s", service, entry_id)
+
+    return handle_service
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -225,91 +257,302 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
-class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
+@dataclass(frozen=True, slots=True)
+class NanoKVMSnapshot:
+    """Data polled from a NanoKVM in a single update.
+
+    Snapshots are immutable: each poll builds a new one and fields that were
+    not refetched share the model instances of the previous snapshot. Fields
+    the NanoKVM failed to report are None.
+    """
+
+    device_info: Any = None
+    hardware_info: Any = None
+    gpio_info: Any = None
+    virtual_device_info: Any = None
+    ssh_state: Any = None
+    mdns_state: Any = None
+    hid_mode: Any = None
+    oled_info: Any = None
+    wifi_status: Any = None
+    mounted_image: Any = None
+    cdrom_status: Any = None
+
+
+# Snapshot field and the client call that fetches it
+SNAPSHOT_ENDPOINTS: tuple[
+    tuple[str, Callable[[NanoKVMClient], Awaitable[Any]]], ...
+] = (
+    ("device_info", NanoKVMClient.get_info),
+    ("hardware_info", NanoKVMClient.get_hardware),
+    ("gpio_info", NanoKVMClient.get_gpio),
+    ("virtual_device_info", NanoKVMClient.get_virtual_device_status),
+    ("ssh_state", NanoKVMClient.get_ssh_state),
+    ("mdns_state", NanoKVMClient.get_mdns_state),
+    ("hid_mode", NanoKVMClient.get_hid_mode),
+    ("oled_info", NanoKVMClient.get_oled_info),
+    ("wifi_status", NanoKVMClient.get_wifi_status),
+    ("mounted_image", NanoKVMClient.get_mounted_image),
+    ("cdrom_status", NanoKVMClient.get_cdrom_status),
+)
+
+# Quasi-static fields that are only fetched every SLOW_POLL_CYCLES updates
+SLOW_SNAPSHOT_FIELDS = frozenset(
+    {
+        "device_info",
+        "hardware_info",
+        "ssh_state",
+        "mdns_state",
+        "hid_mode",
+        "oled_info",
+        "wifi_status",
+    }
+)
+
+
+class CircuitBreaker:
+    """Stop contacting a NanoKVM for a while after repeated failures.
+
+    The breaker opens after ``failure_threshold`` consecutive failures. Once
+    ``recovery_timeout`` seconds have passed it becomes half-open and lets a
+    single probe through: a success closes it, a failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+    ) -> None:
+        """Initialize the circuit breaker in the closed state."""
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._half_open = False
+
+    def is_open(self) -> bool:
+        """Return True if calls should be skipped."""
+        if self._opened_at is None:
+            return False
+        if time.monotonic() - self._opened_at < self.recovery_timeout:
+            return True
+        # Recovery timeout elapsed, allow a single probe
+        self._opened_at = None
+        self._half_open = True
+        return False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        self._failures = 0
+        self._opened_at = None
+        self._half_open = False
+
+    def record_failure(self) -> None:
+        """Count a failed call and open the breaker when needed."""
+        self._failures += 1
+        if self._half_open or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            self._half_open = False
+
+
+class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator[NanoKVMSnapshot]):
     """Class to manage fetching NanoKVM data."""
 
     def __init__(
         self,
         hass: HomeAssistant,
         client: NanoKVMClient,
-        username: str,
-        password: str,
-        device_info: Any, # Add device_info parameter
     ) -> None:
         """Initialize the coordinator."""
         self.client = client
-        self.username = username
-        self.password = password
-        self.device_info = device_info # Initialize device_info here
-        self.hardware_info = None
-        self.gpio_info = None
-        self.virtual_device_info = None
-        self.ssh_state = None
-        self.mdns_state = None
-        self.hid_mode = None
-        self.oled_info = None
-        self.wifi_status = None
-        self.mounted_image = None
-        self.cdrom_status = None
+        # Device info fetched by _async_setup, used to seed the first snapshot
+        self._initial_device_info = None
+        self._breaker = CircuitBreaker()
+        self._cycle = 0
+        self._full_update = True
+        # Consecutive failed fetches by snapshot field
+        self._field_failures: dict[str, int] = {}
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=datetime.timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # The snapshot and the nanokvm models it holds compare by value, so
+            # listeners are only notified when the device state actually changed.
+            always_update=False,
+            # Coalesce refreshes requested by back-to-back button presses
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
         )
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from NanoKVM."""
+    async def _async_setup(self) -> None:
+        """Fetch the device information that identifies the entities before the first refresh."""
         try:
-            # Re-authenticate if needed
-            if not self.client.token:
-                await self.client.authenticate(self.username, self.password)
-
-            async with async_timeout.timeout(10):
-                # Fetch all the data we need
-                self.device_info = await self.client.get_info()
-                self.hardware_info = await self.client.get_hardware()
-                self.gpio_info = await self.client.get_gpio()
-                self.virtual_device_info = await self.client.get_virtual_device_status()
-                self.ssh_state = await self.client.get_ssh_state()
-                self.mdns_state = await self.client.get_mdns_state()
-                self.hid_mode = await self.client.get_hid_mode()
-                self.oled_info = await self.client.get_oled_info()
-                self.wifi_status = await self.client.get_wifi_status()
-                                
-                self.mounted_image = await self.client.get_mounted_image()
-                self.cdrom_status = await self.client.get_cdrom_status()
-
-                return {
-                    "device_info": self.device_info,
-                    "hardware_info": self.hardware_info,
-                    "gpio_info": self.gpio_info,
-                    "virtual_device_info": self.virtual_device_info,
-                    "ssh_state": self.ssh_state,
-                    "mdns_state": self.mdns_state,
-                    "hid_mode": self.hid_mode,
-                    "oled_info": self.oled_info,
-                    "wifi_status": self.wifi_status,
-                    "mounted_image": self.mounted_image,
-                    "cdrom_status": self.cdrom_status,
-                }
-        except (NanoKVMError, aiohttp.ClientError, asyncio.TimeoutError) as err:
-            # If we get an authentication error, try to re-authenticate
-            if isinstance(err, NanoKVMAuthenticationFailure):
-                try:
-                    await self.client.authenticate(self.username, self.password)
-                    # Try the update again
-                    return await self._async_update_data()
-                except Exception as auth_err:
-                    raise UpdateFailed(f"Authentication failed: {auth_err}") from auth_err
-            
+            async with asyncio.timeout(10):
+                self._initial_device_info = await self.client.get_info()
+        except NanoKVMAuthenticationFailure as err:
+            raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
+        except (NanoKVMError, aiohttp.ClientError, TimeoutError) as err:
             raise UpdateFailed(f"Error communicating with NanoKVM: {err}") from err
 
+    async def async_request_full_refresh(self) -> None:
+        """Request a refresh that also fetches the quasi-static endpoints."""
+        self._full_update = True
+        await self.async_request_refresh()
+
+    async def _async_batch_update(self, full_update: bool) -> NanoKVMSnapshot:
+        """Fetch the data we need from the NanoKVM concurrently.
+
+        Without a full update the quasi-static endpoints are skipped and keep
+        their value from the previous snapshot. An endpoint that fails while
+        the others succeed keeps its previous value too, until it has failed
+        STALE_FIELD_MAX_FAILURES times in a row. It is then set to None, as it
+        is when there is no previous snapshot, which makes the entities that
+        read it unavailable.
+        """
+        endpoints = [
+            (field, getter)
+            for field, getter in SNAPSHOT_ENDPOINTS
+            if (full_update or field not in SLOW_SNAPSHOT_FIELDS)
+            # The first snapshot reuses the device info fetched in _async_setup
+            and not (field == "device_info" and self.data is None)
+        ]
+        async with asyncio.timeout(10):
+            results = await asyncio.gather(
+                *(getter(self.client) for _, getter in endpoints),
+                return_exceptions=True,
+            )
+
+        for (field, _), result in zip(endpoints, results):
+            if isinstance(result, BaseException) and (
+                # GPIO is fetched on every poll, so a failure there covers the
+                # case where the whole device is unreachable. The hardware
+                # version decides which entities are set up.
+                field == "gpio_info"
+                or (field == "hardware_info" and self.data is None)
+                or isinstance(result, NanoKVMAuthenticationFailure)
+            ):
+                raise result
+
+        values = {}
+        for (field, _), result in zip(endpoints, results):
+            if not isinstance(result, BaseException):
+                values[field] = result
+                self._field_failures.pop(field, None)
+                continue
+
+            failures = self._field_failures[field] = self._field_failures.get(field, 0) + 1
+            if self.data is None or failures >= STALE_FIELD_MAX_FAILURES:
+                values[field] = None
+            _LOGGER.debug(
+                "Failed to fetch %s from NanoKVM (%s in a row): %s",
+                field,
+                failures,
+                result,
+            )
+
+        if self.data is None:
+            return NanoKVMSnapshot(device_info=self._initial_device_info, **values)
+        return replace(self.data, **values)
+
+    async def _async_reauthenticate(self) -> None:
+        """Log in again with the credentials stored in the config entry."""
+        _LOGGER.debug("NanoKVM rejected the token, authenticating again")
+        try:
+            async with asyncio.timeout(10):
+                await self.client.authenticate(
+                    self.config_entry.data[CONF_USERNAME],
+                    self.config_entry.data[CONF_PASSWORD],
+                )
+        except NanoKVMAuthenticationFailure as err:
+            raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
+        except (NanoKVMError, aiohttp.ClientError, TimeoutError) as err:
+            self._breaker.record_failure()
+            raise UpdateFailed(f"Error communicating with NanoKVM: {err}") from err
+
+    async def _async_update_data(self) -> NanoKVMSnapshot:
+        """Fetch data from NanoKVM."""
+        if self._breaker.is_open():
+            raise UpdateFailed(
+                "NanoKVM is unreachable, skipping update until the circuit breaker recovers"
+            )
+
+        full_update = (
+            self._full_update
+            or self.data is None
+            or self._cycle % SLOW_POLL_CYCLES == 0
+        )
+        attempt = 0
+        reauthenticated = False
+        while True:
+            try:
+                data = await self._async_batch_update(full_update)
+                break
+            except NanoKVMAuthenticationFailure as err:
+                # The token expires and is dropped when the NanoKVM reboots, so
+                # log in again once before asking the user for new credentials
+                if reauthenticated:
+                    raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
+                reauthenticated = True
+                await self._async_reauthenticate()
+            except (aiohttp.ClientError, TimeoutError) as err:
+                # Client errors (4xx) will not go away by retrying
+                attempt += 1
+                if attempt >= UPDATE_RETRY_ATTEMPTS or (
+                    isinstance(err, aiohttp.ClientResponseError) and err.status < 500
+                ):
+                    self._breaker.record_failure()
+                    raise UpdateFailed(f"Error communicating with NanoKVM: {err}") from err
+
+                # Exponential backoff with full jitter
+                delay = random.uniform(
+                    0, min(UPDATE_RETRY_MAX_DELAY, UPDATE_RETRY_BASE_DELAY * 2 ** (attempt - 1))
+                )
+                _LOGGER.debug(
+                    "Error communicating with NanoKVM, retrying in %.1f s: %s", delay, err
+                )
+                await asyncio.sleep(delay)
+            except NanoKVMError as err:
+                self._breaker.record_failure()
+                raise UpdateFailed(f"Error communicating with NanoKVM: {err}") from err
+
+        self._breaker.record_success()
+        self._cycle += 1
+        if full_update:
+            self._full_update = False
+            if self.data is not None:
+                self._async_update_firmware(self.data.device_info, data.device_info)
+        return data
+
+    @callback
+    def _async_update_firmware(self, previous: Any, device_info: Any) -> None:
+        """Push a changed firmware version to the device registry."""
+        if (
+            previous is None
+            or device_info is None
+            or device_info.application == previous.application
+        ):
+            return
+        device_registry = dr.async_get(self.hass)
+        if device := device_registry.async_get_device(
+            identifiers={(DOMAIN, device_info.device_key)}
+        ):
+            device_registry.async_update_device(
+                device.id, sw_version=device_info.application
+            )
+
 
 class NanoKVMEntity(CoordinatorEntity):
     """Base class for NanoKVM entities."""
 
+    # Set from the entity description by the platforms
+    _value_fn: Callable[[NanoKVMDataUpdateCoordinator], Any] = staticmethod(lambda _: None)
+    _available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = staticmethod(
+        lambda _: True
+    )
+
     def __init__(
         self,
         coordinator: NanoKVMDataUpdateCoordinator,
@@ -319,15 +562,35 @@ class NanoKVMEntity(CoordinatorEntity):
         """Initialize the entity."""
         super().__init__(coordinator)
         self._attr_name = name
-        self._attr_unique_id = f"{coordinator.device_info.device_key}_{unique_id_suffix}"
-        
+        self._attr_unique_id = f"{coordinator.data.device_info.device_key}_{unique_id_suffix}"
+
     @property
+    def available(self) -> bool:
+        """Return if the entity is available.
+
+        Fields the NanoKVM failed to report are None in the snapshot, so the
+        lookups of an entity that reads one raise AttributeError.
+        """
+        if not super().available:
+            return False
+        try:
+            self._value_fn(self.coordinator)
+            return bool(self._available_fn(self.coordinator))
+        except AttributeError:
+            return False
+
+    @cached_property
     def device_info(self) -> dict[str, Any]:
-        """Return device information about this NanoKVM device."""
+        """Return device information about this NanoKVM device.
+
+        Built once per entity, as Home Assistant only reads it when the entity
+        is added. Firmware updates are pushed to the device registry by the
+        coordinator instead.
+        """
         return {
-            "identifiers": {(DOMAIN, self.coordinator.device_info.device_key)},
-            "name": f"NanoKVM ({self.coordinator.device_info.mdns})",
+            "identifiers": {(DOMAIN, self.coordinator.data.device_info.device_key)},
+            "name": f"NanoKVM ({self.coordinator.data.device_info.mdns})",
             "manufacturer": "Sipeed",
-            "model": f"NanoKVM {self.coordinator.hardware_info.version.value}",
-            "sw_version": self.coordinator.device_info.application,
+            "model": f"NanoKVM {self.coordinator.data.hardware_info.version.value}",
+            "sw_version": self.coordinator.data.device_info.application,
         }
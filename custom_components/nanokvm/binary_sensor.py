@@ -1,6 +1,7 @@
 """Binary sensor platform for Sipeed NanoKVM."""
 from __future__ import annotations
 
+import operator
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
@@ -32,7 +33,10 @@ from . import NanoKVMDataUpdateCoordinator, NanoKVMEntity
 class NanoKVMBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes NanoKVM binary sensor entity."""
 
-    value_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = None
+    value_fn: Callable[[NanoKVMDataUpdateCoordinator], Any] = None
+    # Static hardware support, checked once when the entities are set up
+    supported_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = lambda _: True
+    # Runtime state, checked on every update
     available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = lambda _: True
 
 
@@ -41,57 +45,57 @@ BINARY_SENSORS: tuple[NanoKVMBinarySensorEntityDescription, ...] = (
         key="power_led",
         name="Power LED",
         icon=ICON_POWER,
-        value_fn=lambda coordinator: coordinator.gpio_info.pwr,
+        value_fn=operator.attrgetter("data.gpio_info.pwr"),
     ),
     NanoKVMBinarySensorEntityDescription(
         key="hdd_led",
         name="HDD LED",
         icon=ICON_DISK,
-        value_fn=lambda coordinator: coordinator.gpio_info.hdd,
+        value_fn=operator.attrgetter("data.gpio_info.hdd"),
         # HDD LED is only valid for Alpha hardware
-        available_fn=lambda coordinator: coordinator.hardware_info.version.value == "Alpha",
+        supported_fn=lambda coordinator: coordinator.data.hardware_info.version.value == "Alpha",
     ),
     NanoKVMBinarySensorEntityDescription(
         key="network_device",
         name="Virtual Network Device",
         icon=ICON_NETWORK,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.virtual_device_info.network,
+        value_fn=operator.attrgetter("data.virtual_device_info.network"),
     ),
     NanoKVMBinarySensorEntityDescription(
         key="disk_device",
         name="Virtual Disk Device",
         icon=ICON_DISK,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.virtual_device_info.disk,
+        value_fn=operator.attrgetter("data.virtual_device_info.disk"),
     ),
     NanoKVMBinarySensorEntityDescription(
         key="ssh_enabled",
         name="SSH Enabled",
         icon=ICON_SSH,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.ssh_state.enabled,
+        value_fn=operator.attrgetter("data.ssh_state.enabled"),
     ),
     NanoKVMBinarySensorEntityDescription(
         key="mdns_enabled",
         name="mDNS Enabled",
         icon=ICON_MDNS,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.mdns_state.enabled,
+        value_fn=operator.attrgetter("data.mdns_state.enabled"),
     ),
     NanoKVMBinarySensorEntityDescription(
         key="oled_present",
         name="OLED Present",
         icon=ICON_OLED,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.oled_info.exist,
+        value_fn=operator.attrgetter("data.oled_info.exist"),
     ),
     NanoKVMBinarySensorEntityDescription(
         key="wifi_supported",
         name="WiFi Supported",
         icon=ICON_WIFI,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.wifi_status.supported,
+        value_fn=operator.attrgetter("data.wifi_status.supported"),
     ),
     NanoKVMBinarySensorEntityDescription(
         key="wifi_connected",
@@ -99,16 +103,16 @@ BINARY_SENSORS: tuple[NanoKVMBinarySensorEntityDescription, ...] = (
         icon=ICON_WIFI,
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.wifi_status.connected,
-        available_fn=lambda coordinator: coordinator.wifi_status.supported,
+        value_fn=operator.attrgetter("data.wifi_status.connected"),
+        available_fn=lambda coordinator: coordinator.data.wifi_status.supported,
     ),
     NanoKVMBinarySensorEntityDescription(
         key="cdrom_mode",
         name="CD-ROM Mode",
         icon=ICON_DISK,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.cdrom_status.cdrom == 1,
-        available_fn=lambda coordinator: coordinator.mounted_image.file != "",
+        value_fn=operator.attrgetter("data.cdrom_status.cdrom"),
+        available_fn=lambda coordinator: coordinator.data.mounted_image.file != "",
     ),
 )
 
@@ -127,7 +131,7 @@ async def async_setup_entry(
             description=description,
         )
         for description in BINARY_SENSORS
-        if description.available_fn(coordinator)
+        if description.supported_fn(coordinator)
     )
 
 
@@ -148,8 +152,10 @@ class NanoKVMBinarySensor(NanoKVMEntity, BinarySensorEntity):
             unique_id_suffix=f"binary_sensor_{description.key}",
         )
         self.entity_description = description
+        self._value_fn = description.value_fn
+        self._available_fn = description.available_fn
 
     @property
     def is_on(self) -> bool:
         """Return the state of the binary sensor."""
-        return self.entity_description.value_fn(self.coordinator)
+        return bool(self._value_fn(self.coordinator))
@@ -28,7 +28,8 @@ class NanoKVMButtonEntityDescription(ButtonEntityDescription):
     """Describes NanoKVM button entity."""
 
     press_fn: Callable[[NanoKVMDataUpdateCoordinator], None] = None
-    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = lambda _: True
+    # Static hardware support, checked once when the entities are set up
+    supported_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = lambda _: True
 
 
 BUTTONS: tuple[NanoKVMButtonEntityDescription, ...] = (
@@ -56,7 +57,7 @@ BUTTONS: tuple[NanoKVMButtonEntityDescription, ...] = (
         icon=ICON_KVM,
         entity_category=EntityCategory.CONFIG,
         press_fn=lambda coordinator: coordinator.client.reset_hdmi(),
-        available_fn=lambda coordinator: coordinator.hardware_info.version.value == "PCIE",
+        supported_fn=lambda coordinator: coordinator.data.hardware_info.version.value == "PCIE",
     ),
     NanoKVMButtonEntityDescription(
         key="reset_hid",
@@ -89,7 +90,7 @@ async def async_setup_entry(
             description=description,
         )
         for description in BUTTONS
-        if description.available_fn(coordinator)
+        if description.supported_fn(coordinator)
     )
 
 
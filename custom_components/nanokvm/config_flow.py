@@ -1,7 +1,9 @@
 """Config flow for Sipeed NanoKVM integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 import aiohttp
@@ -10,8 +12,9 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.data_entry_flow import AbortFlow, FlowResult
+from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.components import zeroconf
 
@@ -21,45 +24,93 @@ from nanokvm.models import GetInfoRsp
 from cachetools import TTLCache
 
 from .const import DEFAULT_USERNAME, DEFAULT_PASSWORD, DOMAIN
+from .util import api_url
 
 _LOGGER = logging.getLogger(__name__)
 
 CONF_IGNORE_SSL = "ignore_cert_warnings"
 
+# Recent discovery probe results by host; None means the device rejected the
+# default credentials. Zeroconf announces the same host repeatedly, so this
+# avoids probing it again for every announcement.
+_PROBE_CACHE: TTLCache[str, tuple[GetInfoRsp, str] | None] = TTLCache(
+    maxsize=64, ttl=300
+)
+# Bounded as well, since every avahi host on the LAN announces itself. Losing a
+# lock to eviction at worst lets a duplicate probe through.
+_PROBE_LOCKS: TTLCache[str, asyncio.Lock] = TTLCache(maxsize=64, ttl=300)
+
+# Discovery clients by URL, so later probes reuse the authentication token
+_CLIENTS: TTLCache[str, NanoKVMClient] = TTLCache(maxsize=64, ttl=3600)
+
+
 async def _async_get_nanokvm_device_info(
     hass: HomeAssistant, host: str, ignore_ssl: bool = False
 ) -> tuple[GetInfoRsp, str] | None:
     """Attempt to connect to the device and retrieve its info without authentication."""
-    url = f"http://{host}/api/"
+    # Concurrent probes for the same host wait for the first one to finish
+    async with _PROBE_LOCKS.setdefault(host, asyncio.Lock()):
+        if host in _PROBE_CACHE:
+            return _PROBE_CACHE[host]
 
-    session = _async_get_clientsession_with_ssl(hass, ignore_ssl)
-    client = NanoKVMClient(url, session)
+        url = f"http://{host}/api/"
 
-    try:
-        # Attempt to authenticate with default credentials (admin/admin)
-        await client.authenticate(DEFAULT_USERNAME, DEFAULT_PASSWORD)
-        device_info = await client.get_info()
+        if (client := _CLIENTS.get(url)) is None:
+            session = _async_get_clientsession_with_ssl(hass, ignore_ssl)
+            client = _CLIENTS[url] = NanoKVMClient(url, session)
 
-        # Use device_key as the unique identifier
-        unique_id = device_info.device_key
+        try:
+            device_info = await _async_get_info_with_default_auth(client)
+
+            # Use device_key as the unique identifier
+            unique_id = device_info.device_key
+
+            _LOGGER.debug(
+                "Adding device %s to discovery cache with URL %s and device_key %s",
+                device_info.mdns,
+                url,
+                unique_id
+            )
+            result = device_info, unique_id
+        except NanoKVMAuthenticationFailure:
+            _CLIENTS.pop(url, None)
+            _LOGGER.debug(
+                "Discovered NanoKVM device at %s requires user credentials.",
+                url,
+            )
+            result = None
+        except (aiohttp.ClientError, NanoKVMError) as err:
+            # Connection errors may be transient, so they are not cached
+            _LOGGER.debug("Failed to connect to %s during discovery: %s", url, err)
+            return None
+
+        _PROBE_CACHE[host] = result
+        return result
+
+
+async def _async_get_info_with_default_auth(client: NanoKVMClient) -> GetInfoRsp:
+    """Fetch the device info, authenticating with the default credentials if needed.
+
+    get_info requires a token, so it cannot overlap with authenticate. Instead a
+    token from an earlier probe is tried first, and the default credentials
+    (admin/admin) are only sent when there is no token or it was rejected.
+    """
+    if client.token:
+        try:
+            return await client.get_info()
+        except NanoKVMAuthenticationFailure:
+            _LOGGER.debug("Discovery token expired, authenticating again")
+
+    await client.authenticate(DEFAULT_USERNAME, DEFAULT_PASSWORD)
+    return await client.get_info()
+
+
+@callback
+def _async_invalidate_probe(host: str | None) -> None:
+    """Forget the discovery probe result for a host."""
+    if host is not None:
+        _PROBE_CACHE.pop(host, None)
 
-        # Store in cache using URL and device_key for better lookup
-        _LOGGER.debug(
-            "Adding device %s to discovery cache with URL %s and device_key %s",
-            device_info.mdns,
-            url,
-            unique_id
-        )
-        return device_info, unique_id
-    except NanoKVMAuthenticationFailure:
-        _LOGGER.debug(
-            "Discovered NanoKVM device at %s requires user credentials.",
-            url,
-        )
-        return None
-    except (aiohttp.ClientError, NanoKVMError) as err:
-        _LOGGER.debug("Failed to connect to %s during discovery: %s", url, err)
-        return None
 
 def _async_get_clientsession_with_ssl(hass, ignore_ssl):
     if ignore_ssl:
@@ -85,13 +136,8 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     ignore_ssl = data.get(CONF_IGNORE_SSL, False)
     session = _async_get_clientsession_with_ssl(hass, ignore_ssl)
 
-    host = data[CONF_HOST]
-    # Ensure the host has a scheme
-    if not host.startswith(("http://", "https://")):
-        host = f"http://{host}"
-    # Ensure the host ends with /api/
-    if not host.endswith("/api/"):
-        host = f"{host}/api/" if host.endswith("/") else f"{host}/api/"
+    if (host := api_url(data[CONF_HOST])) is None:
+        raise CannotConnect
 
     client = NanoKVMClient(host, session)
 
@@ -121,25 +167,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._discovered_host: str | None = None
+        self._discovered_address: str | None = None
         self._discovered_name: str | None = None
         self._discovered_device_key: str | None = None
         self._discovered_unique_id: str | None = None
+        self._discovered_device_info: GetInfoRsp | None = None
         self._default_auth_successful: bool = False
-
-    @callback
-    def _abort_if_unique_id_configured(self) -> None:
-        """Abort if the unique ID is already configured."""
-        if self.unique_id is None:
-            return
-
-        for entry in self._async_current_entries():
-            if entry.unique_id == self.unique_id:
-                _LOGGER.debug(
-                    "Aborting flow because device with unique_id %s is already configured as %s",
-                    self.unique_id,
-                    entry.title
-                )
-                raise AbortFlow("already_configured")
+        self._reauth_entry: config_entries.ConfigEntry | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -194,6 +228,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     # Add the unique_id to the data
                     user_input["unique_id"] = info["device_key"]
                 self._abort_if_unique_id_configured()
+                _async_invalidate_probe(self._discovered_address)
                 return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
@@ -210,84 +245,64 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Get the zeroconf unique ID from properties or use the name
         zeroconf_unique_id = discovery_info.properties.get("id", name)
 
+        # Abort for configured devices before probing, so they are not sent
+        # the default credentials again on every announcement
+        await self.async_set_unique_id(zeroconf_unique_id)
+        self._abort_if_unique_id_configured()
+
+        # Also check entries that only store the unique_id in their data
+        entry = next(
+            (
+                entry
+                for entry in self._async_current_entries()
+                if entry.data.get("unique_id") == zeroconf_unique_id
+            ),
+            None,
+        )
+        if entry is not None:
+            # Entries with a matching unique_id were handled above, so this
+            # entry's unique_id differs and is brought in line
+            _LOGGER.debug(
+                "Device with unique_id %s is already configured as %s (from entry data), "
+                "updating its unique_id from %s",
+                zeroconf_unique_id,
+                entry.title,
+                entry.unique_id,
+            )
+            self.hass.config_entries.async_update_entry(
+                entry, unique_id=zeroconf_unique_id
+            )
+            return self.async_abort(reason="already_configured")
+
         # Attempt to get device info with default credentials
         result = await _async_get_nanokvm_device_info(self.hass, host)
 
         # Store discovered info
         self._discovered_host = discovery_info.hostname
+        self._discovered_address = host
+        self._discovered_unique_id = zeroconf_unique_id
 
         if result:
             device_info, device_key = result
             # If we successfully got device_info, use its mDNS name and device_key
             self._discovered_name = device_info.mdns
             self._discovered_device_key = device_key
-            self._discovered_unique_id = zeroconf_unique_id
+            self._discovered_device_info = device_info
             self._default_auth_successful = True
-
-            # Use zeroconf_unique_id as the unique_id for consistency
-            _LOGGER.debug(
-                "Using zeroconf_unique_id %s as unique_id for device %s",
-                zeroconf_unique_id,
-                self._discovered_name
-            )
-
-            # Check if a device with this unique_id is already configured
-            await self.async_set_unique_id(zeroconf_unique_id)
-
-            # Check if this device is already configured
-            for entry in self._async_current_entries():
-                if entry.unique_id == zeroconf_unique_id:
-                    _LOGGER.debug(
-                        "Device with unique_id %s is already configured as %s",
-                        zeroconf_unique_id,
-                        entry.title
-                    )
-                    return self.async_abort(reason="already_configured")
-
-                # Also check if the unique_id is stored in the entry data
-                if entry.data.get("unique_id") == zeroconf_unique_id:
-                    _LOGGER.debug(
-                        "Device with unique_id %s is already configured as %s (from entry data)",
-                        zeroconf_unique_id,
-                        entry.title
-                    )
-                    # Update the unique_id if it's different
-                    if entry.unique_id != zeroconf_unique_id:
-                        _LOGGER.debug(
-                            "Updating unique_id from %s to %s for entry %s",
-                            entry.unique_id,
-                            zeroconf_unique_id,
-                            entry.title
-                        )
-                        self.hass.config_entries.async_update_entry(
-                            entry, unique_id=zeroconf_unique_id
-                        )
-                    return self.async_abort(reason="already_configured")
-
-            # If we get here, the device is not configured yet
-            self._abort_if_unique_id_configured()
         else:
             # If default credentials failed or other connection error,
             # use the name from zeroconf and fallback to zeroconf_unique_id for display/fallback unique_id
             self._discovered_name = name
             self._discovered_device_key = zeroconf_unique_id  # Fallback unique_id for the entry
-            self._discovered_unique_id = zeroconf_unique_id
             self._default_auth_successful = False
 
-            # Use zeroconf_unique_id as the unique_id
-            _LOGGER.debug(
-                "Using zeroconf_unique_id %s as unique_id for device %s",
-                zeroconf_unique_id,
-                self._discovered_name
-            )
-            await self.async_set_unique_id(zeroconf_unique_id)
-            self._abort_if_unique_id_configured()
-
-            _LOGGER.debug(
-                "Could not get device info for %s, using zeroconf name '%s' for discovery",
-                host,
-                name,
-            )
+        _LOGGER.debug(
+            "Discovered NanoKVM %s at %s with unique_id %s (default credentials %s)",
+            self._discovered_name,
+            host,
+            zeroconf_unique_id,
+            "accepted" if self._default_auth_successful else "not accepted",
+        )
 
         # Set the title for the confirmation dialog
         self.context["title_placeholders"] = {"name": self._discovered_name}
@@ -300,29 +315,20 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle a flow initiated by zeroconf."""
         if user_input is not None:
             if self._default_auth_successful:
-                # If default authentication succeeded, create entry directly
-                # We need to reconstruct the data that validate_input expects
+                # If default authentication succeeded, the discovery probe already
+                # fetched the device info, so the entry is created without
+                # logging in to the device a second time
                 data = {
                     CONF_HOST: self._discovered_host,
                     CONF_USERNAME: DEFAULT_USERNAME,
                     CONF_PASSWORD: DEFAULT_PASSWORD,
                     "unique_id": self._discovered_unique_id,
                 }
-                try:
-                    info = await validate_input(self.hass, data)
-                except CannotConnect:
-                    return self.async_abort(reason="cannot_connect")
-                except InvalidAuth:
-                    # This should not happen if _default_auth_successful is True
-                    _LOGGER.error("Unexpected authentication failure after successful default auth")
-                    return self.async_abort(reason="unknown")
-                except Exception:
-                    _LOGGER.exception("Unexpected exception during direct entry creation")
-                    return self.async_abort(reason="unknown")
 
                 # The unique_id is already set in async_step_zeroconf
+                _async_invalidate_probe(self._discovered_address)
                 return self.async_create_entry(
-                    title=info["title"],
+                    title=f"NanoKVM ({self._discovered_device_info.mdns})",
                     data=data
                 )
             else:
@@ -343,6 +349,61 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             description_placeholders={"name": self._discovered_name},
         )
 
+    async def async_step_reauth(
+        self, entry_data: Mapping[str, Any]
+    ) -> FlowResult:
+        """Handle reauthentication when the stored credentials are rejected."""
+        self._reauth_entry = self.hass.config_entries.async_get_entry(
+            self.context["entry_id"]
+        )
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Ask the user for new credentials."""
+        errors: dict[str, str] = {}
+        entry = self._reauth_entry
+
+        if user_input is not None:
+            data = {**entry.data, **user_input}
+            try:
+                info = await validate_input(self.hass, data)
+            except CannotConnect:
+                errors["base"] = "cannot_connect"
+            except InvalidAuth:
+                errors["base"] = "invalid_auth"
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected exception")
+                errors["base"] = "unknown"
+            else:
+                # Another NanoKVM may now answer at this host. Entries set up
+                # through zeroconf use the zeroconf id as unique_id, so the
+                # device_key is also looked up in the device registry.
+                device_keys = {entry.unique_id} | {
+                    identifier
+                    for device in dr.async_entries_for_config_entry(
+                        dr.async_get(self.hass), entry.entry_id
+                    )
+                    for domain, identifier in device.identifiers
+                    if domain == DOMAIN
+                }
+                if info["device_key"] not in device_keys:
+                    return self.async_abort(reason="wrong_device")
+                return self.async_update_reload_and_abort(entry, data=data)
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_USERNAME, default=entry.data[CONF_USERNAME]): str,
+                    vol.Required(CONF_PASSWORD): str,
+                }
+            ),
+            description_placeholders={"name": entry.title},
+            errors=errors,
+        )
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
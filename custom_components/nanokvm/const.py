@@ -11,6 +11,18 @@ CONF_PASSWORD = "password"
 DEFAULT_USERNAME = "admin"
 DEFAULT_PASSWORD = "admin"
 DEFAULT_SCAN_INTERVAL = 30
+# Generous cap for service calls, which may paste long text or hold a button
+SERVICE_TIMEOUT = 60
+# Quasi-static endpoints are fetched every SLOW_POLL_CYCLES updates
+SLOW_POLL_CYCLES = 10
+REQUEST_REFRESH_COOLDOWN = 0.35
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
+CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 60
+UPDATE_RETRY_ATTEMPTS = 3
+UPDATE_RETRY_BASE_DELAY = 0.5
+UPDATE_RETRY_MAX_DELAY = 5
+# Consecutive failed fetches after which a field is dropped from the snapshot
+STALE_FIELD_MAX_FAILURES = 3
 
 # Services
 SERVICE_PUSH_BUTTON = "push_button"
@@ -21,6 +33,7 @@ SERVICE_RESET_HID = "reset_hid"
 SERVICE_WAKE_ON_LAN = "wake_on_lan"
 
 # Service attributes
+ATTR_ENTRY_ID = "entry_id"
 ATTR_BUTTON_TYPE = "button_type"
 ATTR_DURATION = "duration"
 ATTR_TEXT = "text"
@@ -1,9 +1,10 @@
 """Sensor platform for Sipeed NanoKVM."""
 from __future__ import annotations
 
+import operator
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -24,7 +25,10 @@ from .const import (
     ICON_KVM,
     ICON_OLED,
 )
-from . import NanoKVMDataUpdateCoordinator, NanoKVMEntity
+from . import NanoKVMEntity
+
+if TYPE_CHECKING:
+    from . import NanoKVMDataUpdateCoordinator
 
 
 @dataclass
@@ -32,6 +36,9 @@ class NanoKVMSensorEntityDescription(SensorEntityDescription):
     """Describes NanoKVM sensor entity."""
 
     value_fn: Callable[[NanoKVMDataUpdateCoordinator], Any] = None
+    # Static hardware support, checked once when the entities are set up
+    supported_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = lambda _: True
+    # Runtime state, checked on every update
     available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = lambda _: True
 
 
@@ -41,7 +48,7 @@ SENSORS: tuple[NanoKVMSensorEntityDescription, ...] = (
         name="HID Mode",
         icon=ICON_HID,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.hid_mode.mode.value,
+        value_fn=operator.attrgetter("data.hid_mode.mode.value"),
     ),
     NanoKVMSensorEntityDescription(
         key="oled_sleep",
@@ -51,33 +58,51 @@ SENSORS: tuple[NanoKVMSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement=UnitOfTime.SECONDS,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda coordinator: coordinator.oled_info.sleep,
-        available_fn=lambda coordinator: coordinator.oled_info.exist,
+        value_fn=operator.attrgetter("data.oled_info.sleep"),
+        # Created when the OLED info is missing, it is unavailable until fetched
+        supported_fn=lambda coordinator: (
+            coordinator.data.oled_info is None or coordinator.data.oled_info.exist
+        ),
     ),
     NanoKVMSensorEntityDescription(
         key="hardware_version",
         name="Hardware Version",
         icon=ICON_KVM,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.hardware_info.version.value,
+        value_fn=operator.attrgetter("data.hardware_info.version.value"),
     ),
     NanoKVMSensorEntityDescription(
         key="application_version",
         name="Application Version",
         icon=ICON_KVM,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.device_info.application,
+        value_fn=operator.attrgetter("data.device_info.application"),
     ),
     NanoKVMSensorEntityDescription(
         key="mounted_image",
         name="Mounted Image",
         icon=ICON_IMAGE,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.mounted_image.file,
-        available_fn=lambda coordinator: coordinator.mounted_image.file != "",
+        value_fn=operator.attrgetter("data.mounted_image.file"),
+        available_fn=lambda coordinator: coordinator.data.mounted_image.file != "",
     ),
 )
 
+# Split once at import so setup only evaluates the non-default supported_fn
+_DEFAULT_SUPPORTED_FN = NanoKVMSensorEntityDescription.__dataclass_fields__[
+    "supported_fn"
+].default
+_ALWAYS_SUPPORTED = tuple(
+    description
+    for description in SENSORS
+    if description.supported_fn is _DEFAULT_SUPPORTED_FN
+)
+_CONDITIONAL = tuple(
+    description
+    for description in SENSORS
+    if description.supported_fn is not _DEFAULT_SUPPORTED_FN
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -87,14 +112,17 @@ async def async_setup_entry(
     """Set up NanoKVM sensor based on a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(
-        NanoKVMSensor(
-            coordinator=coordinator,
-            description=description,
-        )
-        for description in SENSORS
-        if description.available_fn(coordinator)
-    )
+    entities = [
+        NanoKVMSensor(coordinator=coordinator, description=description)
+        for description in _ALWAYS_SUPPORTED
+    ]
+    entities += [
+        NanoKVMSensor(coordinator=coordinator, description=description)
+        for description in _CONDITIONAL
+        if description.supported_fn(coordinator)
+    ]
+
+    async_add_entities(entities)
 
 
 class NanoKVMSensor(NanoKVMEntity, SensorEntity):
@@ -114,8 +142,10 @@ class NanoKVMSensor(NanoKVMEntity, SensorEntity):
             unique_id_suffix=f"sensor_{description.key}",
         )
         self.entity_description = description
+        self._value_fn = description.value_fn
+        self._available_fn = description.available_fn
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        return self.entity_description.value_fn(self.coordinator)
+        return self._value_fn(self.coordinator)
@@ -3,8 +3,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable
+import operator
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
@@ -13,6 +15,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from nanokvm.client import NanoKVMClient
 from nanokvm.models import VirtualDevice, GpioType
 
 from .const import (
@@ -27,15 +30,40 @@ from . import NanoKVMDataUpdateCoordinator, NanoKVMEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# How long to wait for the PC to power off, and how often to check
+SHUTDOWN_TIMEOUT = 300
+SHUTDOWN_POLL_INTERVAL = 5
+
 
 @dataclass
 class NanoKVMSwitchEntityDescription(SwitchEntityDescription):
     """Describes NanoKVM switch entity."""
 
     value_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = None
-    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = lambda _: True
-    turn_on_fn: Callable[[NanoKVMDataUpdateCoordinator], None] = None
-    turn_off_fn: Callable[[NanoKVMDataUpdateCoordinator], None] = None
+    turn_on_fn: Callable[[NanoKVMClient], Awaitable[Any]] = None
+    turn_off_fn: Callable[[NanoKVMClient], Awaitable[Any]] = None
+    # The turn on/off calls flip the current state instead of setting it
+    toggle: bool = False
+
+
+def _toggle_virtual_device(
+    device: VirtualDevice,
+) -> Callable[[NanoKVMClient], Awaitable[Any]]:
+    """Return a function that toggles a virtual device.
+
+    The NanoKVM only exposes a toggle for virtual devices, so turning on and
+    off is the same call.
+    """
+    return lambda client: client.update_virtual_device(device)
+
+
+_toggle_virtual_network = _toggle_virtual_device(VirtualDevice.NETWORK)
+_toggle_virtual_disk = _toggle_virtual_device(VirtualDevice.DISK)
+
+
+def _push_power_button(client: NanoKVMClient) -> Awaitable[Any]:
+    """Press the power button, which toggles the power of the PC."""
+    return client.push_button(GpioType.POWER, 200)
 
 
 SWITCHES: tuple[NanoKVMSwitchEntityDescription, ...] = (
@@ -44,48 +72,56 @@ SWITCHES: tuple[NanoKVMSwitchEntityDescription, ...] = (
         name="SSH",
         icon=ICON_SSH,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda coordinator: coordinator.ssh_state.enabled,
-        turn_on_fn=lambda coordinator: coordinator.client.enable_ssh(),
-        turn_off_fn=lambda coordinator: coordinator.client.disable_ssh(),
+        value_fn=operator.attrgetter("data.ssh_state.enabled"),
+        turn_on_fn=operator.methodcaller("enable_ssh"),
+        turn_off_fn=operator.methodcaller("disable_ssh"),
     ),
     NanoKVMSwitchEntityDescription(
         key="mdns",
         name="mDNS",
         icon=ICON_MDNS,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda coordinator: coordinator.mdns_state.enabled,
-        turn_on_fn=lambda coordinator: coordinator.client.enable_mdns(),
-        turn_off_fn=lambda coordinator: coordinator.client.disable_mdns(),
+        value_fn=operator.attrgetter("data.mdns_state.enabled"),
+        turn_on_fn=operator.methodcaller("enable_mdns"),
+        turn_off_fn=operator.methodcaller("disable_mdns"),
     ),
     NanoKVMSwitchEntityDescription(
         key="virtual_network",
         name="Virtual Network",
         icon=ICON_NETWORK,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda coordinator: coordinator.virtual_device_info.network,
-        turn_on_fn=lambda coordinator: coordinator.client.update_virtual_device(VirtualDevice.NETWORK),
-        turn_off_fn=lambda coordinator: coordinator.client.update_virtual_device(VirtualDevice.NETWORK),
+        value_fn=operator.attrgetter("data.virtual_device_info.network"),
+        turn_on_fn=_toggle_virtual_network,
+        turn_off_fn=_toggle_virtual_network,
+        toggle=True,
     ),
     NanoKVMSwitchEntityDescription(
         key="virtual_disk",
         name="Virtual Disk",
         icon=ICON_DISK,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda coordinator: coordinator.virtual_device_info.disk,
-        turn_on_fn=lambda coordinator: coordinator.client.update_virtual_device(VirtualDevice.DISK),
-        turn_off_fn=lambda coordinator: coordinator.client.update_virtual_device(VirtualDevice.DISK),
+        value_fn=operator.attrgetter("data.virtual_device_info.disk"),
+        turn_on_fn=_toggle_virtual_disk,
+        turn_off_fn=_toggle_virtual_disk,
+        toggle=True,
     ),
     NanoKVMSwitchEntityDescription(
         key="power",
         name="Power",
         icon=ICON_POWER,
-        value_fn=lambda coordinator: coordinator.gpio_info.pwr,
-        turn_on_fn=lambda coordinator: coordinator.client.push_button(GpioType.POWER, 200),
-        turn_off_fn=lambda coordinator: coordinator.client.push_button(GpioType.POWER, 200),
+        value_fn=operator.attrgetter("data.gpio_info.pwr"),
+        turn_on_fn=_push_power_button,
+        turn_off_fn=_push_power_button,
+        toggle=True,
     ),
 )
 
 
+def _switch_class(description: NanoKVMSwitchEntityDescription) -> type[NanoKVMSwitch]:
+    """Return the entity class for a switch description."""
+    return NanoKVMPowerSwitch if description.key == "power" else NanoKVMSwitch
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -94,28 +130,12 @@ async def async_setup_entry(
     """Set up NanoKVM switch based on a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for description in SWITCHES:
-        if not description.available_fn(coordinator):
-            continue
-            
-        if description.key == "power":
-            entities.append(
-                NanoKVMPowerSwitch(
-                    coordinator=coordinator,
-                    description=description,
-                )
-            )
-            continue
-        else:
-            entities.append(
-                NanoKVMSwitch(
-                    coordinator=coordinator,
-                    description=description,
-                )
-            )
-    
-    async_add_entities(entities)
+    async_add_entities(
+        [
+            _switch_class(description)(coordinator=coordinator, description=description)
+            for description in SWITCHES
+        ]
+    )
 
 
 class NanoKVMSwitch(NanoKVMEntity, SwitchEntity):
@@ -135,21 +155,32 @@ class NanoKVMSwitch(NanoKVMEntity, SwitchEntity):
             unique_id_suffix=f"switch_{description.key}",
         )
         self.entity_description = description
+        self._value_fn = description.value_fn
+        # The client never changes for an entry, so bind it once
+        self._turn_on = partial(description.turn_on_fn, coordinator.client)
+        self._turn_off = partial(description.turn_off_fn, coordinator.client)
 
     @property
     def is_on(self) -> bool:
         """Return the state of the switch."""
-        return self.entity_description.value_fn(self.coordinator)
+        return self._value_fn(self.coordinator)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch."""
-        await self.entity_description.turn_on_fn(self.coordinator)
-        await self.coordinator.async_request_refresh()
+        # Toggles would flip the state back, so skip them when already on.
+        # Other calls are idempotent and always go through, as the polled
+        # state may be stale.
+        if self.entity_description.toggle and self.is_on:
+            return
+        await self._turn_on()
+        await self.coordinator.async_request_full_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
-        await self.entity_description.turn_off_fn(self.coordinator)
-        await self.coordinator.async_request_refresh()
+        if self.entity_description.toggle and not self.is_on:
+            return
+        await self._turn_off()
+        await self.coordinator.async_request_full_refresh()
 
 
 class NanoKVMPowerSwitch(NanoKVMSwitch):
@@ -157,27 +188,28 @@ class NanoKVMPowerSwitch(NanoKVMSwitch):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch."""
-        await self.entity_description.turn_on_fn(self.coordinator)
+        # The power button is a toggle, so don't press it when already on
+        if self.is_on:
+            return
+        await self._turn_on()
         await asyncio.sleep(1)  # Give the device a moment to respond
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the power switch with monitoring for actual shutdown."""
-        await self.entity_description.turn_off_fn(self.coordinator)
+        if not self.is_on:
+            return
+        await self._turn_off()
 
         # Wait for the device to be off, with a timeout
-        SHUTDOWN_TIMEOUT = 300 
-        SHUTDOWN_POLL_INTERVAL = 5
-
-        start_time = self.hass.loop.time()
-        while self.hass.loop.time() - start_time < SHUTDOWN_TIMEOUT:
-            await self.coordinator.async_request_refresh()  # Request a refresh of coordinator data
-            if self.coordinator.gpio_info and not self.coordinator.gpio_info.pwr:
-                # Device is off, refresh one last time to ensure state is updated
-                await self.coordinator.async_request_refresh()
-                return
-            await asyncio.sleep(SHUTDOWN_POLL_INTERVAL)
-
-        # If timeout is reached and device is still on, log a warning
-        _LOGGER.warning("Device did not turn off within %s seconds", SHUTDOWN_TIMEOUT)
-        await self.coordinator.async_request_refresh()  # Refresh to show current (likely still on) state
+        try:
+            async with asyncio.timeout(SHUTDOWN_TIMEOUT):
+                while True:
+                    # Refresh directly so the debouncer doesn't delay the poll
+                    await self.coordinator.async_refresh()
+                    if not self.coordinator.data.gpio_info.pwr:
+                        return
+                    await asyncio.sleep(SHUTDOWN_POLL_INTERVAL)
+        except TimeoutError:
+            # If timeout is reached and device is still on, log a warning
+            _LOGGER.warning("Device did not turn off within %s seconds", SHUTDOWN_TIMEOUT)
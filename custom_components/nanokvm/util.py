@@ -0,0 +1,23 @@
+"""Helpers for the Sipeed NanoKVM integration."""
+from __future__ import annotations
+
+import re
+
+# Optional scheme, the host with an optional port, and an optional path prefix
+# for NanoKVMs served behind a reverse proxy
+_HOST_RE = re.compile(
+    r"(?P<scheme>https?://)?"
+    r"(?P<host>(?:\[[0-9A-Fa-f:.]+\]|[^/:\s\[\]?#]+)(?::\d+)?)"
+    r"(?P<path>/[^\s?#]*)?"
+)
+
+
+def api_url(host: str) -> str | None:
+    """Return the API URL for a configured host, or None if it is not valid.
+
+    A trailing /api in the path is optional, any other path is kept as a prefix.
+    """
+    if (match := _HOST_RE.fullmatch(host)) is None:
+        return None
+    path = (match["path"] or "").rstrip("/").removesuffix("/api")
+    return f"{match['scheme'] or 'http://'}{match['host']}{path}/api/"